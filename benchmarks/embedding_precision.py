@@ -0,0 +1,112 @@
+"""Benchmark clustering on reduced-dimension and int8-quantized embeddings.
+
+Uses synthetic unit vectors grouped around related topics (no API calls) and
+compares each configuration against full-precision 1536-dim float32 clustering:
+
+- time spent in ``assign_clusters``
+- size of the embedding working set
+- cluster agreement (adjusted Rand index vs the full-precision labels)
+
+Shorter vectors are obtained by truncating and re-normalizing, which is what the
+``dimensions`` parameter of text-embedding-3 models does server-side.
+
+    uv run python benchmarks/embedding_precision.py --problems 5000
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+import numpy as np
+from rich.console import Console
+from rich.table import Table
+
+from newsletter_mining.clustering import assign_clusters
+from newsletter_mining.quantization import quantize_int8
+
+console = Console()
+
+FULL_DIMENSIONS = 1536
+
+
+def synthetic_embeddings(n: int, topics: int, seed: int) -> np.ndarray:
+    """Unit vectors around ``topics`` centers, themselves grouped in families of related topics."""
+    rng = np.random.default_rng(seed)
+    families = rng.normal(size=(max(1, topics // 4), FULL_DIMENSIONS))
+    families /= np.linalg.norm(families, axis=1, keepdims=True)
+    offsets = rng.normal(size=(topics, FULL_DIMENSIONS))
+    offsets /= np.linalg.norm(offsets, axis=1, keepdims=True)
+    centers = families[rng.integers(0, len(families), topics)] + 0.6 * offsets
+    centers /= np.linalg.norm(centers, axis=1, keepdims=True)
+
+    weights = rng.zipf(1.6, topics).astype(np.float64)
+    assignment = rng.choice(topics, size=n, p=weights / weights.sum())
+    noise = rng.normal(scale=0.35 / np.sqrt(FULL_DIMENSIONS), size=(n, FULL_DIMENSIONS))
+    vectors = centers[assignment] + noise
+    return (vectors / np.linalg.norm(vectors, axis=1, keepdims=True)).astype(np.float32)
+
+
+def truncate(vectors: np.ndarray, dimensions: int) -> np.ndarray:
+    short = vectors[:, :dimensions]
+    return short / np.linalg.norm(short, axis=1, keepdims=True)
+
+
+def adjusted_rand_index(a: np.ndarray, b: np.ndarray) -> float:
+    contingency = np.zeros((a.max() + 1, b.max() + 1), dtype=np.int64)
+    np.add.at(contingency, (a, b), 1)
+
+    def pairs(x: np.ndarray) -> float:
+        return float((x * (x - 1) // 2).sum())
+
+    total = pairs(np.array([len(a)]))
+    index = pairs(contingency)
+    rows, cols = pairs(contingency.sum(axis=1)), pairs(contingency.sum(axis=0))
+    expected = rows * cols / total if total else 0.0
+    maximum = (rows + cols) / 2
+    return 1.0 if maximum == expected else (index - expected) / (maximum - expected)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--problems", type=int, default=5000)
+    parser.add_argument("--topics", type=int, default=200)
+    parser.add_argument("--threshold", type=float, default=0.85)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    full = synthetic_embeddings(args.problems, args.topics, args.seed)
+
+    table = Table(title=f"Clustering {args.problems} problems (threshold {args.threshold})")
+    for column in ["Dimensions", "Format", "Working set", "Time", "Speedup", "Clusters", "ARI vs full"]:
+        table.add_column(column, justify="right")
+
+    baseline_labels = None
+    baseline_time = 0.0
+    for dimensions in [FULL_DIMENSIONS, 512, 256]:
+        vectors = truncate(full, dimensions)
+        for fmt in ["float32", "int8"]:
+            embeddings = quantize_int8(vectors) if fmt == "int8" else vectors
+
+            start = time.perf_counter()
+            labels = assign_clusters(embeddings, args.threshold)
+            elapsed = time.perf_counter() - start
+
+            if baseline_labels is None:
+                baseline_labels, baseline_time = labels, elapsed
+
+            table.add_row(
+                str(dimensions),
+                fmt,
+                f"{embeddings.nbytes / 1e6:.1f} MB",
+                f"{elapsed:.2f}s",
+                f"{baseline_time / elapsed:.1f}x",
+                str(labels.max() + 1),
+                f"{adjusted_rand_index(baseline_labels, labels):.3f}",
+            )
+
+    console.print(table)
+
+
+if __name__ == "__main__":
+    main()
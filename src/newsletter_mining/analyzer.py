@@ -3,6 +3,7 @@ from __future__ import annotations
 import json
 import time
 import uuid
+from collections.abc import Callable
 
 import openai
 from rich.console import Console
@@ -60,8 +61,18 @@ If no problems are found, return an empty problems array. Do not invent problems
 """
 
 
-def analyze_newsletter(newsletter: ParsedNewsletter, max_retries: int = 2) -> AnalysisResult:
-    """Analyze a parsed newsletter using GPT-4o to extract problems and pain points."""
+def analyze_newsletter(
+    newsletter: ParsedNewsletter,
+    max_retries: int = 2,
+    on_problem: Callable[[ExtractedProblem], None] | None = None,
+) -> AnalysisResult:
+    """Analyze a parsed newsletter using GPT-4o to extract problems and pain points.
+
+    When ``on_problem`` is given, the completion is streamed and each problem is passed
+    to it as soon as its JSON object is complete, long before the full response arrives.
+    The returned result is the same as in non-streaming mode. Once a problem has been
+    emitted, errors are raised instead of retried, so callers never see duplicates.
+    """
     api_key = require_openai_key()
     client = openai.OpenAI(api_key=api_key)
 
@@ -78,8 +89,9 @@ Newsletter content:
 ---"""
 
     for attempt in range(max_retries + 1):
+        streamed: list[ExtractedProblem] = []
         try:
-            response = client.chat.completions.create(
+            request = dict(
                 model="gpt-4o",
                 max_tokens=4096,
                 temperature=0.1,
@@ -90,25 +102,24 @@ Newsletter content:
                 ],
             )
 
-            raw_text = response.choices[0].message.content or ""
+            if on_problem is None:
+                response = client.chat.completions.create(**request)
+                raw_text = response.choices[0].message.content or ""
+            else:
+                stream_parser = ProblemStreamParser()
+                for chunk in client.chat.completions.create(**request, stream=True):
+                    if not chunk.choices or not chunk.choices[0].delta.content:
+                        continue
+                    for p in stream_parser.feed(chunk.choices[0].delta.content):
+                        problem = _build_problem(p)
+                        streamed.append(problem)
+                        on_problem(problem)
+                raw_text = stream_parser.text
+
             data = _parse_json_response(raw_text)
 
-            problems = []
-            for i, p in enumerate(data.get("problems", [])):
-                problems.append(
-                    ExtractedProblem(
-                        id=str(uuid.uuid4())[:8],
-                        problem_summary=p.get("problem_summary", ""),
-                        problem_detail=p.get("problem_detail", ""),
-                        category=p.get("category", "other"),
-                        severity=p.get("severity", "medium"),
-                        original_quote=p.get("original_quote", ""),
-                        context=p.get("context", ""),
-                        signals=p.get("signals", []),
-                        mentioned_tools=p.get("mentioned_tools", []),
-                        target_audience=p.get("target_audience", ""),
-                    )
-                )
+            # Problems already emitted while streaming are reused as-is (same ids)
+            problems = streamed + [_build_problem(p) for p in data.get("problems", [])[len(streamed):]]
 
             return AnalysisResult(
                 source_file=newsletter.file_path,
@@ -121,20 +132,102 @@ Newsletter content:
             )
 
         except (json.JSONDecodeError, KeyError) as e:
-            if attempt < max_retries:
+            if attempt < max_retries and not streamed:
                 console.print(f"[yellow]Retry {attempt + 1}/{max_retries}: JSON parse error: {e}[/yellow]")
                 time.sleep(1)
             else:
-                console.print(f"[red]Failed to parse GPT-4o response after {max_retries + 1} attempts[/red]")
+                console.print(f"[red]Failed to parse GPT-4o response after {attempt + 1} attempts[/red]")
                 raise
         except openai.APIError as e:
-            if attempt < max_retries:
+            if attempt < max_retries and not streamed:
                 console.print(f"[yellow]Retry {attempt + 1}/{max_retries}: API error: {e}[/yellow]")
                 time.sleep(2)
             else:
                 raise
 
 
+def _build_problem(p: dict) -> ExtractedProblem:
+    return ExtractedProblem(
+        id=str(uuid.uuid4())[:8],
+        problem_summary=p.get("problem_summary", ""),
+        problem_detail=p.get("problem_detail", ""),
+        category=p.get("category", "other"),
+        severity=p.get("severity", "medium"),
+        original_quote=p.get("original_quote", ""),
+        context=p.get("context", ""),
+        signals=p.get("signals", []),
+        mentioned_tools=p.get("mentioned_tools", []),
+        target_audience=p.get("target_audience", ""),
+    )
+
+
+class ProblemStreamParser:
+    """Incrementally extract the objects of the top-level ``problems`` array from streamed JSON.
+
+    Feed text chunks as they arrive; ``feed`` returns the problem dicts whose closing
+    brace has been seen. Only string/escape state and nesting depth are tracked, so
+    each character is scanned once. The full text is kept in ``text`` for the final parse.
+    """
+
+    def __init__(self) -> None:
+        self.text = ""
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._string_start = -1
+        self._last_string = ""
+        self._key = ""
+        self._in_problems = False
+        self._object_start = -1
+        self._stopped = False
+
+    def feed(self, chunk: str) -> list[dict]:
+        self.text += chunk
+        completed: list[dict] = []
+        text = self.text
+
+        for i in range(self._pos, len(text)):
+            char = text[i]
+
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+                    if self._depth == 1:
+                        self._last_string = json.loads(text[self._string_start:i + 1])
+                continue
+
+            if char == '"':
+                self._in_string = True
+                self._string_start = i
+            elif char == ":" and self._depth == 1:
+                self._key = self._last_string
+            elif char in "{[":
+                if self._depth == 1 and char == "[" and self._key == "problems":
+                    self._in_problems = True
+                elif self._in_problems and self._depth == 2 and char == "{":
+                    self._object_start = i
+                self._depth += 1
+            elif char in "}]":
+                self._depth -= 1
+                if self._in_problems and self._depth == 2 and char == "}" and not self._stopped:
+                    try:
+                        completed.append(json.loads(text[self._object_start:i + 1]))
+                    except json.JSONDecodeError:
+                        # Stop emitting so later problems keep their position; the
+                        # final full parse picks up the rest.
+                        self._stopped = True
+                elif self._in_problems and self._depth == 1:
+                    self._in_problems = False
+
+        self._pos = len(text)
+        return completed
+
+
 def _parse_json_response(text: str) -> dict:
     """Parse JSON from model response, handling markdown code blocks."""
     text = text.strip()
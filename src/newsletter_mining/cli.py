@@ -1,24 +1,37 @@
 from __future__ import annotations
 
 import argparse
-import json
+import os
+import socket
 import sys
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
+import numpy as np
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
 from newsletter_mining.analyzer import analyze_newsletter
 from newsletter_mining.clustering import cluster_problems, enrich_cluster_summaries
-from newsletter_mining.embeddings import generate_embeddings_batch
-from newsletter_mining.models import AnalysisResult, ClusterReport, ProblemWithEmbedding
-from newsletter_mining.parser import parse_file
+from newsletter_mining.config import embedding_dimensions
+from newsletter_mining.dedup import group_duplicates
+from newsletter_mining.embeddings import MODEL as EMBEDDING_MODEL
+from newsletter_mining.embeddings import generate_embeddings_batch, problem_text, text_hash
+from newsletter_mining.models import ClusterReport, ExtractedProblem
+from newsletter_mining.parser import parse_date, parse_file
+from newsletter_mining.quantization import QuantizedEmbeddings, quantize_int8
+from newsletter_mining.store import OUTPUT_DIR, ResultStore
+from newsletter_mining.trends import BUCKETS, compute_trends
+from newsletter_mining.work_queue import LeaseHeartbeat, WorkQueue
 
 console = Console()
 
-OUTPUT_DIR = Path("output")
+# Texts per embeddings request in 'cluster' (the API accepts up to 2048)
+EMBEDDING_BATCH_SIZE = 512
+
 SUPPORTED_EXTENSIONS = {".html", ".htm", ".eml", ".txt"}
 
 
@@ -36,21 +49,143 @@ def main(argv: list[str] | None = None) -> None:
         nargs="+",
         help="File(s) or directory to analyze",
     )
+    analyze_parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Stream GPT-4o output: show problems as they are extracted and embed them right away",
+    )
+
+    # enqueue
+    enqueue_parser = subparsers.add_parser(
+        "enqueue",
+        help="Add newsletter file(s) to the work queue processed by 'worker'",
+    )
+    enqueue_parser.add_argument(
+        "paths",
+        nargs="+",
+        help="File(s) or directory to enqueue",
+    )
+
+    # worker
+    worker_parser = subparsers.add_parser("worker", help="Analyze queued files (run one per process/host)")
+    worker_parser.add_argument(
+        "--lease",
+        type=float,
+        default=300,
+        help="Lease duration in seconds, renewed while the file is being analyzed (default: 300)",
+    )
+    worker_parser.add_argument(
+        "--max-attempts",
+        type=int,
+        default=3,
+        help="Attempts per file before it is marked failed (default: 3)",
+    )
+    worker_parser.add_argument(
+        "--wait",
+        action="store_true",
+        help="Keep polling for new files instead of exiting when the queue is drained",
+    )
 
     # cluster
-    subparsers.add_parser("cluster", help="Cluster extracted problems")
+    cluster_parser = subparsers.add_parser("cluster", help="Cluster extracted problems")
+    cluster_parser.add_argument(
+        "--trend-bucket",
+        choices=BUCKETS,
+        default="month",
+        help="Time bucket used to compute cluster trends (default: month)",
+    )
+    cluster_parser.add_argument(
+        "--trend-window",
+        type=int,
+        default=6,
+        help="Number of most recent buckets used for the trend slope (default: 6)",
+    )
+    cluster_parser.add_argument(
+        "--dimensions",
+        type=_positive_int,
+        default=None,
+        help="Embedding dimensions to request (default: EMBEDDING_DIMENSIONS or the model default, 1536)",
+    )
+    cluster_parser.add_argument(
+        "--int8",
+        action="store_true",
+        help="Quantize embeddings to int8 as they are loaded or fetched, for a 4x smaller "
+        "embedding working set while clustering (the cache stays float32)",
+    )
+    cluster_parser.add_argument(
+        "--near-duplicates",
+        type=float,
+        nargs="?",
+        const=0.8,
+        default=None,
+        metavar="THRESHOLD",
+        help="Also collapse near-duplicate problems whose word-shingle similarity reaches "
+        "THRESHOLD (default when given: 0.8) before embedding",
+    )
 
     # report
-    subparsers.add_parser("report", help="Display a summary report")
+    report_parser = subparsers.add_parser("report", help="Display a summary report")
+    report_parser.add_argument(
+        "--top",
+        type=int,
+        default=10,
+        help="Number of rows per breakdown table and clusters to show (default: 10)",
+    )
+    report_parser.add_argument(
+        "--since",
+        help="Only include newsletters dated on or after this date, excluding undated ones (e.g. 2024-01-31)",
+    )
+    report_parser.add_argument(
+        "--after",
+        metavar="CURSOR",
+        help="List the newsletters after this cursor, as printed at the end of the previous page "
+        "(default: start with the most recent)",
+    )
+    report_parser.add_argument(
+        "--page-size",
+        type=int,
+        default=20,
+        help="Newsletters per page (default: 20)",
+    )
+
+    # import-json
+    import_parser = subparsers.add_parser(
+        "import-json",
+        help="Import legacy *_analysis.json / cluster_report.json files into the result store",
+    )
+    import_parser.add_argument(
+        "directory",
+        nargs="?",
+        default=str(OUTPUT_DIR),
+        help="Directory containing the JSON files (default: output/)",
+    )
 
     args = parser.parse_args(argv)
 
     if args.command == "analyze":
-        cmd_analyze(args.paths)
+        cmd_analyze(args.paths, stream=args.stream)
+    elif args.command == "enqueue":
+        cmd_enqueue(args.paths)
+    elif args.command == "worker":
+        cmd_worker(lease_seconds=args.lease, max_attempts=args.max_attempts, wait=args.wait)
     elif args.command == "cluster":
-        cmd_cluster()
+        cmd_cluster(
+            trend_bucket=args.trend_bucket,
+            trend_window=args.trend_window,
+            dimensions=args.dimensions,
+            int8=args.int8,
+            near_duplicates=args.near_duplicates,
+        )
     elif args.command == "report":
-        cmd_report()
+        cmd_report(top=args.top, since=args.since, after=args.after, page_size=args.page_size)
+    elif args.command == "import-json":
+        cmd_import_json(args.directory)
+
+
+def _positive_int(value: str) -> int:
+    if not value.isdigit() or int(value) == 0:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value!r}")
+    return int(value)
 
 
 def _collect_files(paths: list[str]) -> list[Path]:
@@ -68,15 +203,22 @@ def _collect_files(paths: list[str]) -> list[Path]:
     return sorted(set(files))
 
 
-def cmd_analyze(paths: list[str]) -> None:
-    """Analyze one or more newsletter files."""
+def cmd_analyze(paths: list[str], stream: bool = False) -> None:
+    """Analyze one or more newsletter files.
+
+    With ``stream``, problems are printed as soon as GPT-4o emits them and each one is
+    embedded in the background while the rest of the response streams in; the vectors
+    are cached in the store so ``cluster`` does not request them again.
+    """
     files = _collect_files(paths)
     if not files:
         console.print("[red]No supported files found.[/red]")
         sys.exit(1)
 
     console.print(f"[bold]Analyzing {len(files)} file(s)...[/bold]\n")
-    OUTPUT_DIR.mkdir(exist_ok=True)
+    store = ResultStore()
+    executor = ThreadPoolExecutor(max_workers=4) if stream else None
+    dimensions = embedding_dimensions() if stream else None
 
     for file_path in files:
         console.print(f"[blue]Parsing:[/blue] {file_path}")
@@ -89,137 +231,274 @@ def cmd_analyze(paths: list[str]) -> None:
         console.print(f"  Text length: {len(newsletter.body_text)} chars")
         console.print(f"[blue]Analyzing with GPT-4o...[/blue]")
 
-        result = analyze_newsletter(newsletter)
+        if executor is None:
+            result = analyze_newsletter(newsletter)
+            store.save_result(result)
+        else:
+            started = time.perf_counter()
+            pending: list[tuple[str, Future]] = []
 
-        # Save result
-        output_name = f"{file_path.stem}_analysis.json"
-        output_path = OUTPUT_DIR / output_name
-        output_path.write_text(
-            result.model_dump_json(indent=2),
-            encoding="utf-8",
-        )
+            def on_problem(p: ExtractedProblem) -> None:
+                if not pending:
+                    console.print(f"  [dim]First problem after {time.perf_counter() - started:.1f}s[/dim]")
+                console.print(f"    [{p.severity.value}] {p.problem_summary}")
+                text = problem_text(p)
+                pending.append((text, executor.submit(generate_embeddings_batch, [text], dimensions)))
+
+            result = analyze_newsletter(newsletter, on_problem=on_problem)
+            store.save_result(result)
+            _cache_streamed_embeddings(store, pending, dimensions)
 
         # Display summary
         console.print(f"[green]  Found {len(result.problems)} problem(s)[/green]")
-        for p in result.problems:
-            console.print(f"    [{p.severity.value}] {p.problem_summary}")
-        console.print(f"  Saved to: {output_path}\n")
-
+        if executor is None:
+            for p in result.problems:
+                console.print(f"    [{p.severity.value}] {p.problem_summary}")
+        console.print(f"  Saved to: {store.path}\n")
+
+    if executor is not None:
+        executor.shutdown()
+    store.close()
     console.print("[bold green]Analysis complete.[/bold green]")
 
 
-def _load_analysis_results() -> list[AnalysisResult]:
-    """Load all analysis result JSON files from the output directory."""
-    results: list[AnalysisResult] = []
-    if not OUTPUT_DIR.exists():
-        return results
+def cmd_enqueue(paths: list[str]) -> None:
+    """Register newsletter files in the work queue."""
+    files = _collect_files(paths)
+    if not files:
+        console.print("[red]No supported files found.[/red]")
+        sys.exit(1)
 
-    for json_file in sorted(OUTPUT_DIR.glob("*_analysis.json")):
+    with ResultStore() as store:
+        queue = WorkQueue(store)
+        added = queue.enqueue(files)
+        counts = queue.counts()
+
+    console.print(f"[green]Enqueued {added} file(s) ({len(files) - added} already queued)[/green]")
+    console.print(f"Queue: {_format_queue_counts(counts)}")
+
+
+def cmd_worker(lease_seconds: float = 300, max_attempts: int = 3, wait: bool = False, poll_seconds: float = 5) -> None:
+    """Claim queued files one at a time, analyze them and save the results."""
+    worker_id = f"{socket.gethostname()}:{os.getpid()}"
+    store = ResultStore()
+    queue = WorkQueue(store)
+    console.print(f"[bold]Worker {worker_id} started[/bold]")
+
+    while True:
+        lease = queue.claim(worker_id, lease_seconds, max_attempts)
+        if lease is None:
+            counts = queue.counts()
+            # Leased items may still come back if their worker dies
+            if not wait and not counts.get("pending") and not counts.get("leased"):
+                break
+            time.sleep(poll_seconds)
+            continue
+
+        console.print(f"[blue]Claimed:[/blue] {lease.path} (attempt {lease.attempt})")
+        try:
+            with LeaseHeartbeat(store.path, lease, lease_seconds) as heartbeat:
+                newsletter = parse_file(lease.path)
+                result = analyze_newsletter(newsletter) if newsletter.body_text.strip() else None
+        except Exception as e:
+            console.print(f"[red]  Failed: {e}[/red]")
+            queue.fail(lease, str(e), max_attempts)
+            continue
+
+        if heartbeat.lost.is_set() or not queue.complete(lease, result):
+            console.print("[yellow]  Lease lost to another worker, result discarded[/yellow]")
+        elif result is None:
+            console.print(f"[yellow]  Skipped (empty content)[/yellow]")
+        else:
+            console.print(f"[green]  Found {len(result.problems)} problem(s), saved to {store.path}[/green]")
+
+    console.print(f"[bold green]Queue drained.[/bold green] {_format_queue_counts(queue.counts())}")
+    store.close()
+
+
+def _format_queue_counts(counts: dict[str, int]) -> str:
+    return ", ".join(f"{counts.get(status, 0)} {status}" for status in ["pending", "leased", "done", "failed"])
+
+
+def _cache_streamed_embeddings(
+    store: ResultStore,
+    pending: list[tuple[str, Future]],
+    dimensions: int | None,
+) -> None:
+    """Wait for background embeddings and cache them; failures are left to ``cluster``."""
+    hashes, vectors = [], []
+    for text, future in pending:
         try:
-            data = json.loads(json_file.read_text(encoding="utf-8"))
-            results.append(AnalysisResult(**data))
+            vectors.append(future.result()[0])
+            hashes.append(text_hash(text))
         except Exception as e:
-            console.print(f"[yellow]Warning: Could not load {json_file}: {e}[/yellow]")
+            console.print(f"[yellow]  Warning: Could not embed problem, 'cluster' will retry: {e}[/yellow]")
+    if hashes:
+        store.save_embeddings(hashes, np.asarray(vectors, dtype=np.float32), EMBEDDING_MODEL, dimensions)
+
+
+def _embed_with_cache(
+    store: ResultStore,
+    texts: list[str],
+    dimensions: int | None,
+    int8: bool,
+) -> np.ndarray | QuantizedEmbeddings:
+    """Embed distinct texts, reusing float32 vectors cached in the store and caching the new ones.
+
+    Vectors are written into the result as each cache chunk is read or each API
+    batch arrives, quantized on the way in when ``int8`` is set, so no float32
+    copy of all the embeddings is ever held in memory.
+    """
+    hashes = [text_hash(t) for t in texts]
+    position = {h: i for i, h in enumerate(hashes)}
+    filled = np.zeros(len(texts), dtype=bool)
+    embeddings: np.ndarray | QuantizedEmbeddings | None = None
+
+    def place(chunk_hashes: list[str], vectors: np.ndarray) -> None:
+        nonlocal embeddings
+        if embeddings is None:
+            shape = (len(texts), vectors.shape[1])
+            if int8:
+                embeddings = QuantizedEmbeddings(
+                    codes=np.empty(shape, dtype=np.int8),
+                    scales=np.empty(len(texts), dtype=np.float32),
+                )
+            else:
+                embeddings = np.empty(shape, dtype=np.float32)
+        rows = [position[h] for h in chunk_hashes]
+        if int8:
+            quantized = quantize_int8(vectors)
+            embeddings.codes[rows] = quantized.codes
+            embeddings.scales[rows] = quantized.scales
+        else:
+            embeddings[rows] = vectors
+        filled[rows] = True
+
+    for chunk_hashes, vectors in store.iter_embeddings(hashes, EMBEDDING_MODEL, dimensions):
+        place(chunk_hashes, vectors)
+
+    missing = np.flatnonzero(~filled).tolist()
+    console.print(f"  {len(texts) - len(missing)} cached, {len(missing)} to generate")
+    for start in range(0, len(missing), EMBEDDING_BATCH_SIZE):
+        batch = missing[start:start + EMBEDDING_BATCH_SIZE]
+        vectors = np.asarray(
+            generate_embeddings_batch([texts[i] for i in batch], dimensions=dimensions),
+            dtype=np.float32,
+        )
+        batch_hashes = [hashes[i] for i in batch]
+        store.save_embeddings(batch_hashes, vectors, EMBEDDING_MODEL, dimensions)
+        place(batch_hashes, vectors)
 
-    return results
+    if embeddings is None:
+        return np.empty((0, dimensions or 0), dtype=np.float32)
+    return embeddings
 
 
-def cmd_cluster() -> None:
+def cmd_import_json(directory: str) -> None:
+    """Import legacy per-file JSON output into the result store."""
+    with ResultStore() as store:
+        imported, cluster_imported = store.import_json(directory)
+
+    console.print(f"[green]Imported {imported} analysis result(s) into {store.path}[/green]")
+    if cluster_imported:
+        console.print("[green]Imported cluster report[/green]")
+
+
+def cmd_cluster(
+    trend_bucket: str = "month",
+    trend_window: int = 6,
+    dimensions: int | None = None,
+    int8: bool = False,
+    near_duplicates: float | None = None,
+) -> None:
     """Cluster problems from all analysis results."""
-    results = _load_analysis_results()
-    if not results:
-        console.print("[red]No analysis results found in output/. Run 'analyze' first.[/red]")
+    store = ResultStore()
+    if not store.count_newsletters():
+        console.print("[red]No analysis results found in the result store. Run 'analyze' first.[/red]")
         sys.exit(1)
 
-    # Collect all problems
-    all_problems: list[ProblemWithEmbedding] = []
-    for r in results:
-        for p in r.problems:
-            all_problems.append(ProblemWithEmbedding(
-                problem=p,
-                source_file=r.source_file,
-            ))
+    all_problems = list(store.iter_problems())
 
     if not all_problems:
         console.print("[yellow]No problems found in analysis results.[/yellow]")
         return
 
-    console.print(f"[bold]Generating embeddings for {len(all_problems)} problems...[/bold]")
-    texts = [f"{p.problem.problem_summary}. {p.problem.problem_detail}" for p in all_problems]
-    embeddings = generate_embeddings_batch(texts)
+    texts = [problem_text(p.problem) for p in all_problems]
+    groups = group_duplicates(all_problems, texts, near_threshold=near_duplicates)
 
-    for pw, emb in zip(all_problems, embeddings):
-        pw.embedding = emb
+    console.print(
+        f"[bold]Generating embeddings for {len(groups)} unique problem(s) "
+        f"({len(all_problems) - len(groups)} duplicate(s) collapsed)...[/bold]"
+    )
+    embeddings = _embed_with_cache(
+        store,
+        [texts[group[0]] for group in groups],
+        dimensions=dimensions or embedding_dimensions(),
+        int8=int8,
+    )
 
     console.print("[bold]Clustering problems...[/bold]")
-    report = cluster_problems(all_problems)
+    report = cluster_problems(all_problems, embeddings=embeddings, groups=groups)
 
     console.print(f"[bold]Enriching cluster summaries with GPT-4o...[/bold]")
     report = enrich_cluster_summaries(report)
+    report = compute_trends(report, bucket=trend_bucket, window=trend_window)
 
-    # Save cluster report
-    output_path = OUTPUT_DIR / "cluster_report.json"
-    # Serialize without the embeddings (too large)
-    report_data = report.model_dump()
-    report_data.pop("problems", None)
-    output_path.write_text(
-        json.dumps(report_data, indent=2, default=str),
-        encoding="utf-8",
-    )
+    # Save cluster report (embeddings are not persisted)
+    store.save_cluster_report(report)
+    store.close()
 
     console.print(f"\n[green]Clustered {report.total_problems} problems into {report.total_clusters} cluster(s)[/green]")
-    console.print(f"Saved to: {output_path}\n")
+    console.print(f"Saved to: {store.path}\n")
 
     _display_cluster_report(report)
 
 
-def cmd_report() -> None:
+def cmd_report(top: int = 10, since: str | None = None, after: str | None = None, page_size: int = 20) -> None:
     """Display a summary report from existing results."""
-    results = _load_analysis_results()
-
-    # Try to load cluster report
-    cluster_path = OUTPUT_DIR / "cluster_report.json"
-    cluster_report = None
-    if cluster_path.exists():
-        try:
-            data = json.loads(cluster_path.read_text(encoding="utf-8"))
-            cluster_report = ClusterReport(**data)
-        except Exception:
-            pass
-
-    if not results and not cluster_report:
-        console.print("[red]No results found in output/. Run 'analyze' first.[/red]")
-        sys.exit(1)
-
-    # Analysis summary
-    if results:
-        _display_analysis_summary(results)
+    top = max(top, 0)
+    page_size = max(page_size, 1)
+    since_dt = None
+    if since:
+        since_dt = parse_date(since)
+        if since_dt is None:
+            console.print(f"[red]Invalid --since date: {since}[/red]")
+            sys.exit(1)
+
+    with ResultStore() as store:
+        has_results = store.count_newsletters() > 0
+        cluster_report = store.load_cluster_report(limit=top)
+
+        if not has_results and not cluster_report:
+            console.print("[red]No results found in the result store. Run 'analyze' first.[/red]")
+            sys.exit(1)
+
+        # Analysis summary
+        if has_results:
+            _display_analysis_summary(store, top=top, since=since_dt)
+            _display_newsletter_page(store, since=since_dt, after=after, page_size=page_size)
 
     # Cluster summary
     if cluster_report:
         console.print()
         _display_cluster_report(cluster_report)
-    elif results:
+    elif has_results:
         console.print("\n[dim]Run 'cluster' to group similar problems together.[/dim]")
 
 
-def _display_analysis_summary(results: list[AnalysisResult]) -> None:
-    total_problems = sum(len(r.problems) for r in results)
+def _display_analysis_summary(store: ResultStore, top: int, since: datetime | None) -> None:
+    total_newsletters = sum(count for _, count in store.aggregate_counts("newsletters", since=since))
+    total_problems = sum(count for _, count in store.aggregate_counts("problems", since=since))
 
     console.print(Panel(
-        f"[bold]{len(results)}[/bold] newsletters analyzed\n"
-        f"[bold]{total_problems}[/bold] problems extracted",
+        f"[bold]{total_newsletters}[/bold] newsletters analyzed\n"
+        f"[bold]{total_problems}[/bold] problems extracted"
+        + (f"\n[dim]Since {since.date().isoformat()}[/dim]" if since else ""),
         title="Analysis Summary",
     ))
 
     # Problems by severity
-    severity_counts: dict[str, int] = {}
-    category_counts: dict[str, int] = {}
-    for r in results:
-        for p in r.problems:
-            severity_counts[p.severity.value] = severity_counts.get(p.severity.value, 0) + 1
-            category_counts[p.category] = category_counts.get(p.category, 0) + 1
-
+    severity_counts = dict(store.aggregate_counts("severity", since=since))
     if severity_counts:
         table = Table(title="Problems by Severity")
         table.add_column("Severity", style="bold")
@@ -230,15 +509,38 @@ def _display_analysis_summary(results: list[AnalysisResult]) -> None:
                 table.add_row(f"[{color}]{sev}[/{color}]", str(severity_counts[sev]))
         console.print(table)
 
-    if category_counts:
-        table = Table(title="Problems by Category")
-        table.add_column("Category", style="bold")
+    for dimension, title in [("category", "Category"), ("tool", "Tool"), ("sender", "Sender")]:
+        counts = store.aggregate_counts(dimension, since=since, limit=top)
+        if counts:
+            table = Table(title=f"Problems by {title}")
+            table.add_column(title, style="bold")
+            table.add_column("Count", justify="right")
+            for key, count in counts:
+                table.add_row(key, str(count))
+            console.print(table)
+
+    monthly = store.monthly_problem_counts(since=since)[-top:] if top else []
+    if monthly:
+        table = Table(title="Problems by Month")
+        table.add_column("Month", style="bold")
         table.add_column("Count", justify="right")
-        for cat, count in sorted(category_counts.items(), key=lambda x: -x[1]):
-            table.add_row(cat, str(count))
+        for month, count in monthly:
+            table.add_row(month, str(count))
         console.print(table)
 
-    # Detail per newsletter
+
+def _display_newsletter_page(store: ResultStore, since: datetime | None, after: str | None, page_size: int) -> None:
+    """Print one page of newsletters (most recent first) with their problems."""
+    try:
+        results, next_cursor = store.results_page(since=since, limit=page_size, after=after)
+    except ValueError:
+        console.print(f"[red]Invalid --after cursor: {after}[/red]")
+        sys.exit(1)
+    if not results:
+        console.print("\n[dim]No more newsletters.[/dim]")
+        return
+
+    console.print(f"\n[bold]Newsletters{' (continued)' if after else ''}[/bold]")
     for r in results:
         if r.problems:
             console.print(f"\n[bold]{r.newsletter_subject or r.source_file}[/bold]")
@@ -248,6 +550,10 @@ def _display_analysis_summary(results: list[AnalysisResult]) -> None:
                 if p.mentioned_tools:
                     console.print(f"    Tools: {', '.join(p.mentioned_tools)}")
 
+    if next_cursor:
+        since_arg = f" --since {since.date().isoformat()}" if since else ""
+        console.print(f"\n[dim]More results: report{since_arg} --after {next_cursor}[/dim]")
+
 
 def _display_cluster_report(report: ClusterReport) -> None:
     console.print(Panel(
@@ -269,5 +575,11 @@ def _display_cluster_report(report: ClusterReport) -> None:
         )
         if cluster.cluster_summary:
             console.print(f"  {cluster.cluster_summary}")
+        if cluster.trend_series:
+            recent = list(zip(report.trend_buckets, cluster.trend_series))[-6:]
+            console.print(
+                f"  [dim]Mentions by {report.trend_bucket}: "
+                f"{', '.join(f'{label} {count}' for label, count in recent)}[/dim]"
+            )
         if cluster.sources:
             console.print(f"  [dim]Sources: {', '.join(Path(s).name for s in cluster.sources)}[/dim]")
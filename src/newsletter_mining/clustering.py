@@ -13,6 +13,7 @@ from newsletter_mining.models import (
     ProblemCluster,
     ProblemWithEmbedding,
 )
+from newsletter_mining.quantization import QuantizedEmbeddings
 
 console = Console()
 
@@ -31,40 +32,40 @@ def cosine_similarity(a: list[float], b: list[float]) -> float:
 def cluster_problems(
     problems: list[ProblemWithEmbedding],
     threshold: float = 0.85,
+    embeddings: np.ndarray | QuantizedEmbeddings | None = None,
+    groups: list[list[int]] | None = None,
 ) -> ClusterReport:
     """Cluster problems by cosine similarity using incremental assignment.
 
     For each problem, find the closest existing cluster centroid.
     If similarity > threshold, assign to that cluster. Otherwise, create a new cluster.
-    """
-    clusters: list[dict] = []  # Each has: problem_ids, embeddings, sources
-
-    for pw in problems:
-        if not pw.embedding:
-            continue
 
-        best_cluster_idx = -1
-        best_similarity = -1.0
-
-        for i, cluster in enumerate(clusters):
-            # Compare against cluster centroid (mean of embeddings)
-            centroid = np.mean(cluster["embeddings"], axis=0).tolist()
-            sim = cosine_similarity(pw.embedding, centroid)
-            if sim > best_similarity:
-                best_similarity = sim
-                best_cluster_idx = i
-
-        if best_similarity >= threshold and best_cluster_idx >= 0:
-            clusters[best_cluster_idx]["problem_ids"].append(pw.problem.id)
-            clusters[best_cluster_idx]["embeddings"].append(pw.embedding)
-            if pw.source_file not in clusters[best_cluster_idx]["sources"]:
-                clusters[best_cluster_idx]["sources"].append(pw.source_file)
-        else:
-            clusters.append({
-                "problem_ids": [pw.problem.id],
-                "embeddings": [pw.embedding],
-                "sources": [pw.source_file],
-            })
+    ``embeddings`` optionally provides the vectors as a matrix (float32 or int8-quantized),
+    in which case ``ProblemWithEmbedding.embedding`` is ignored. Rows are aligned with
+    ``problems``, or with ``groups`` when given: each group is a list of indices into
+    ``problems`` sharing one vector (see ``dedup.group_duplicates``). A group is clustered
+    once, weighted by its size, and every member keeps its own id and source.
+    """
+    if embeddings is None:
+        members = [i for i, pw in enumerate(problems) if pw.embedding]
+        embeddings = np.asarray([problems[i].embedding for i in members], dtype=np.float32)
+        groups = [[i] for i in members]
+    elif groups is None:
+        groups = [[i] for i in range(len(problems))]
+
+    weights = np.fromiter((len(g) for g in groups), dtype=np.float32, count=len(groups))
+    labels = assign_clusters(embeddings, threshold, weights=weights) if groups else []
+
+    clusters: list[dict] = []  # Each has: problem_ids, sources
+    for group, label in zip(groups, labels):
+        if label == len(clusters):
+            clusters.append({"problem_ids": [], "sources": []})
+        cluster = clusters[label]
+        for i in group:
+            pw = problems[i]
+            cluster["problem_ids"].append(pw.problem.id)
+            if pw.source_file not in cluster["sources"]:
+                cluster["sources"].append(pw.source_file)
 
     # Build ProblemCluster objects
     problem_clusters = []
@@ -86,13 +87,66 @@ def cluster_problems(
     problem_clusters.sort(key=lambda c: c.mention_count, reverse=True)
 
     return ClusterReport(
-        total_problems=len([p for p in problems if p.embedding]),
+        total_problems=sum(len(g) for g in groups),
         total_clusters=len(problem_clusters),
         clusters=problem_clusters,
         problems=problems,
     )
 
 
+def assign_clusters(
+    embeddings: np.ndarray | QuantizedEmbeddings,
+    threshold: float = 0.85,
+    weights: np.ndarray | None = None,
+) -> np.ndarray:
+    """Assign each vector, in order, to the most similar centroid or to a new cluster.
+
+    Centroids are kept as running float32 sums (cosine similarity to the mean equals
+    cosine similarity to the sum), so each step is one matrix-vector product over the
+    existing clusters. Quantized vectors are dequantized one row at a time. ``weights``
+    counts each vector that many times in the centroids (e.g. collapsed duplicates).
+
+    Returns the cluster label of each vector; labels are numbered in creation order.
+    """
+    n = len(embeddings)
+    labels = np.empty(n, dtype=np.int64)
+    if n == 0:
+        return labels
+
+    quantized = isinstance(embeddings, QuantizedEmbeddings)
+    dim = embeddings.dimensions if quantized else embeddings.shape[1]
+    sums = np.empty((min(n, 64), dim), dtype=np.float32)
+    sum_norms = np.empty(len(sums), dtype=np.float32)
+    k = 0
+
+    for i in range(n):
+        x = embeddings.row(i) if quantized else np.asarray(embeddings[i], dtype=np.float32)
+        x_norm = np.linalg.norm(x)
+        if weights is not None:
+            x = x * weights[i]
+            x_norm = x_norm * weights[i]
+
+        if k:
+            denom = sum_norms[:k] * x_norm
+            sims = np.divide(sums[:k] @ x, denom, out=np.zeros(k, dtype=np.float32), where=denom > 0)
+            best = int(np.argmax(sims))
+            if sims[best] >= threshold:
+                sums[best] += x
+                sum_norms[best] = np.linalg.norm(sums[best])
+                labels[i] = best
+                continue
+
+        if k == len(sums):
+            sums = np.concatenate([sums, np.empty_like(sums)])
+            sum_norms = np.concatenate([sum_norms, np.empty_like(sum_norms)])
+        sums[k] = x
+        sum_norms[k] = x_norm
+        labels[i] = k
+        k += 1
+
+    return labels
+
+
 def enrich_cluster_summaries(report: ClusterReport) -> ClusterReport:
     """Use GPT-4o to generate descriptive summaries for each cluster."""
     api_key = require_openai_key()
@@ -117,7 +171,7 @@ def enrich_cluster_summaries(report: ClusterReport) -> ClusterReport:
 Problems:
 {chr(10).join(problem_texts)}
 
-        Respond in JSON: {{"cluster_name": "...", "cluster_summary": "...", "trend": "emerging|growing|stable|declining"}}"""
+        Respond in JSON: {{"cluster_name": "...", "cluster_summary": "..."}}"""
 
         try:
             response = client.chat.completions.create(
@@ -137,7 +191,6 @@ Problems:
             data = json.loads(raw)
             cluster.cluster_name = data.get("cluster_name", cluster.cluster_name)
             cluster.cluster_summary = data.get("cluster_summary", "")
-            cluster.trend = data.get("trend", "stable")
         except Exception as e:
             console.print(f"[yellow]Warning: Could not generate summary for cluster {cluster.cluster_id}: {e}[/yellow]")
 
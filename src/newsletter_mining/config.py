@@ -13,6 +13,9 @@ def load_config() -> dict[str, str]:
 
     config = {
         "openai_api_key": os.getenv("OPENAI_API_KEY", ""),
+        "embedding_dimensions": os.getenv("EMBEDDING_DIMENSIONS", ""),
+        "result_store_path": os.getenv("RESULT_STORE_PATH", ""),
+        "store_journal_mode": os.getenv("STORE_JOURNAL_MODE", "wal"),
     }
 
     return config
@@ -24,3 +27,25 @@ def require_openai_key() -> str:
     if not key:
         raise SystemExit("OPENAI_API_KEY is not set. Copy .env.example to .env and fill in your key.")
     return key
+
+
+def embedding_dimensions() -> int | None:
+    """Embedding size requested from the API, or None for the model default."""
+    value = load_config()["embedding_dimensions"]
+    if not value:
+        return None
+    if not value.isdigit() or int(value) == 0:
+        raise SystemExit(f"EMBEDDING_DIMENSIONS must be a positive integer, got {value!r}.")
+    return int(value)
+
+
+def store_journal_mode() -> str:
+    """SQLite journal mode of the result store.
+
+    WAL (the default) needs shared memory, so stores on a volume shared between hosts
+    must use ``delete`` instead.
+    """
+    mode = load_config()["store_journal_mode"].lower()
+    if mode not in ("wal", "delete", "truncate"):
+        raise SystemExit(f"STORE_JOURNAL_MODE must be wal, delete or truncate, got {mode!r}.")
+    return mode
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import hashlib
+import re
+from collections.abc import Callable
+
+import numpy as np
+
+from newsletter_mining.models import ProblemWithEmbedding
+
+SHINGLE_SIZE = 3
+MINHASH_PERMUTATIONS = 64
+MINHASH_BANDS = 16
+_MERSENNE_PRIME = (1 << 61) - 1
+
+
+def group_duplicates(
+    problems: list[ProblemWithEmbedding],
+    texts: list[str],
+    near_threshold: float | None = None,
+) -> list[list[int]]:
+    """Group problems that can share a single embedding.
+
+    Two problems are grouped when their embedding texts are identical, when they carry
+    the same non-empty ``original_quote`` (the same extract syndicated across
+    newsletters), or, if ``near_threshold`` is set, when the Jaccard similarity of
+    their normalized word shingles reaches it.
+
+    Returns lists of indices into ``problems``, in order of first appearance; the first
+    index of each group is its representative.
+    """
+    parent = list(range(len(problems)))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    def union(i: int, j: int) -> None:
+        ri, rj = find(i), find(j)
+        if ri != rj:
+            parent[max(ri, rj)] = min(ri, rj)
+
+    first_by_key: dict[tuple[str, str], int] = {}
+    for i, (pw, text) in enumerate(zip(problems, texts)):
+        keys = [("text", _digest(text))]
+        quote = _normalize(pw.problem.original_quote)
+        if quote:
+            keys.append(("quote", _digest(quote)))
+        for key in keys:
+            if key in first_by_key:
+                union(first_by_key[key], i)
+            else:
+                first_by_key[key] = i
+
+    if near_threshold is not None:
+        # Exact copies are already merged: one representative per group is enough
+        representatives = [i for i in range(len(problems)) if find(i) == i]
+        _union_near_duplicates(representatives, texts, near_threshold, find, union)
+
+    groups: dict[int, list[int]] = {}
+    for i in range(len(problems)):
+        groups.setdefault(find(i), []).append(i)
+    return list(groups.values())
+
+
+def _union_near_duplicates(
+    indices: list[int],
+    texts: list[str],
+    threshold: float,
+    find: Callable[[int], int],
+    union: Callable[[int, int], None],
+) -> None:
+    """Union the texts at ``indices`` whose shingle Jaccard similarity is >= threshold.
+
+    Candidates come from MinHash locality-sensitive hashing (banded signatures), so
+    only texts sharing a band are compared exactly instead of all pairs. Within a
+    band bucket, only one member per group is compared, so members that an earlier
+    bucket already merged are not compared again.
+    """
+    shingles = [_shingles(_normalize(texts[i])) for i in indices]
+    signatures = _minhash(shingles)
+    rows_per_band = MINHASH_PERMUTATIONS // MINHASH_BANDS
+
+    compared: set[tuple[int, int]] = set()
+    for band in range(MINHASH_BANDS):
+        buckets: dict[bytes, list[int]] = {}
+        band_rows = signatures[:, band * rows_per_band:(band + 1) * rows_per_band]
+        for k, row in enumerate(band_rows):
+            if shingles[k]:
+                buckets.setdefault(row.tobytes(), []).append(k)
+        for members in buckets.values():
+            if len(members) < 2:
+                continue
+            first_by_group: dict[int, int] = {}
+            for k in members:
+                first_by_group.setdefault(find(indices[k]), k)
+            candidates = list(first_by_group.values())
+            for a in range(len(candidates)):
+                for b in range(a + 1, len(candidates)):
+                    ka, kb = candidates[a], candidates[b]
+                    if (ka, kb) in compared or find(indices[ka]) == find(indices[kb]):
+                        continue
+                    compared.add((ka, kb))
+                    overlap = len(shingles[ka] & shingles[kb])
+                    if overlap / len(shingles[ka] | shingles[kb]) >= threshold:
+                        union(indices[ka], indices[kb])
+
+
+def _minhash(shingles: list[set[int]]) -> np.ndarray:
+    rng = np.random.default_rng(0)
+    a = rng.integers(1, _MERSENNE_PRIME, size=MINHASH_PERMUTATIONS, dtype=np.uint64)
+    b = rng.integers(0, _MERSENNE_PRIME, size=MINHASH_PERMUTATIONS, dtype=np.uint64)
+
+    signatures = np.full((len(shingles), MINHASH_PERMUTATIONS), np.iinfo(np.uint64).max, dtype=np.uint64)
+    for i, values in enumerate(shingles):
+        if values:
+            x = np.fromiter(values, dtype=np.uint64, count=len(values))[:, None]
+            # Wrapping uint64 arithmetic is fine here: we only need a consistent permutation
+            signatures[i] = ((a * x + b) % _MERSENNE_PRIME).min(axis=0)
+    return signatures
+
+
+def _shingles(text: str) -> set[int]:
+    words = text.split()
+    if len(words) < SHINGLE_SIZE:
+        return {_hash64(" ".join(words))} if words else set()
+    return {_hash64(" ".join(words[i:i + SHINGLE_SIZE])) for i in range(len(words) - SHINGLE_SIZE + 1)}
+
+
+def _normalize(text: str) -> str:
+    return " ".join(re.sub(r"[^\w\s]", " ", text.lower()).split())
+
+
+def _digest(text: str) -> str:
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+def _hash64(text: str) -> int:
+    return int.from_bytes(hashlib.blake2b(text.encode("utf-8"), digest_size=8).digest(), "little")
@@ -1,13 +1,26 @@
 from __future__ import annotations
 
+import hashlib
+
 import openai
 
 from newsletter_mining.config import require_openai_key
+from newsletter_mining.models import ExtractedProblem, ProblemExcerpt
 
 MODEL = "text-embedding-3-small"
 
 
-def generate_embedding(text: str) -> list[float]:
+def problem_text(problem: ExtractedProblem | ProblemExcerpt) -> str:
+    """Text embedded for a problem."""
+    return f"{problem.problem_summary}. {problem.problem_detail}"
+
+
+def text_hash(text: str) -> str:
+    """Cache key of an embedded text."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def generate_embedding(text: str, dimensions: int | None = None) -> list[float]:
     """Generate an embedding vector for a single text using OpenAI."""
     api_key = require_openai_key()
     client = openai.OpenAI(api_key=api_key)
@@ -15,13 +28,17 @@ def generate_embedding(text: str) -> list[float]:
     response = client.embeddings.create(
         model=MODEL,
         input=text,
+        **_dimensions_kwargs(dimensions),
     )
 
     return response.data[0].embedding
 
 
-def generate_embeddings_batch(texts: list[str]) -> list[list[float]]:
-    """Generate embedding vectors for a batch of texts using OpenAI."""
+def generate_embeddings_batch(texts: list[str], dimensions: int | None = None) -> list[list[float]]:
+    """Generate embedding vectors for a batch of texts using OpenAI.
+
+    ``dimensions`` shortens the vectors server-side (text-embedding-3 models only).
+    """
     if not texts:
         return []
 
@@ -32,8 +49,13 @@ def generate_embeddings_batch(texts: list[str]) -> list[list[float]]:
     response = client.embeddings.create(
         model=MODEL,
         input=texts,
+        **_dimensions_kwargs(dimensions),
     )
 
     # Sort by index to preserve input order
     sorted_data = sorted(response.data, key=lambda x: x.index)
     return [item.embedding for item in sorted_data]
+
+
+def _dimensions_kwargs(dimensions: int | None) -> dict[str, int]:
+    return {"dimensions": dimensions} if dimensions else {}
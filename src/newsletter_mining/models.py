@@ -33,6 +33,15 @@ class ExtractedProblem(BaseModel):
     target_audience: str = Field(default="", description="Who experiences this problem")
 
 
+class ProblemExcerpt(BaseModel):
+    """The fields of an extracted problem that clustering reads (see ``ResultStore.iter_problems``)."""
+
+    id: str
+    problem_summary: str
+    problem_detail: str
+    original_quote: str = ""
+
+
 class ParsedNewsletter(BaseModel):
     file_path: str
     format: str = Field(description="File format: html, eml, txt")
@@ -60,12 +69,14 @@ class ProblemCluster(BaseModel):
     problem_ids: list[str] = Field(default_factory=list)
     mention_count: int = 0
     trend: Trend = Field(default=Trend.STABLE)
+    trend_series: list[int] = Field(default_factory=list, description="Mentions per time bucket, aligned with ClusterReport.trend_buckets")
     sources: list[str] = Field(default_factory=list, description="Source newsletters mentioning this cluster")
 
 
 class ProblemWithEmbedding(BaseModel):
-    problem: ExtractedProblem
+    problem: ExtractedProblem | ProblemExcerpt
     source_file: str
+    published_ts: float | None = Field(default=None, description="Newsletter date as a Unix timestamp, None if undated")
     embedding: list[float] = Field(default_factory=list)
 
 
@@ -73,5 +84,7 @@ class ClusterReport(BaseModel):
     generated_at: datetime = Field(default_factory=datetime.now)
     total_problems: int = 0
     total_clusters: int = 0
+    trend_bucket: str = Field(default="month", description="Time bucket of the trend series: week or month")
+    trend_buckets: list[str] = Field(default_factory=list, description="Labels of the trend series buckets")
     clusters: list[ProblemCluster] = Field(default_factory=list)
     problems: list[ProblemWithEmbedding] = Field(default_factory=list, exclude=True)
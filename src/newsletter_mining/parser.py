@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import email
+from datetime import datetime, timezone
 from email import policy
+from email.utils import parsedate_to_datetime
 from pathlib import Path
 
 from bs4 import BeautifulSoup
@@ -99,3 +101,25 @@ def _parse_txt(path: Path) -> ParsedNewsletter:
         format="txt",
         body_text=text,
     )
+
+
+def parse_date(value: str) -> datetime | None:
+    """Parse a newsletter date (RFC 2822 email header or ISO 8601) into an aware datetime.
+
+    Naive values are assumed to be UTC. Returns None when the value cannot be parsed.
+    """
+    value = value.strip()
+    if not value:
+        return None
+
+    try:
+        parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        try:
+            parsed = datetime.fromisoformat(value)
+        except ValueError:
+            return None
+
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
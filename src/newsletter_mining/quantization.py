@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+
+
+@dataclass
+class QuantizedEmbeddings:
+    """Embeddings stored as int8 codes with one float32 scale per vector.
+
+    ``codes[i] * scales[i]`` approximates the original vector; cosine ranking is
+    barely affected while the working set is 4x smaller than float32.
+    """
+
+    codes: np.ndarray  # (n, dim) int8
+    scales: np.ndarray  # (n,) float32
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    @property
+    def dimensions(self) -> int:
+        return self.codes.shape[1]
+
+    @property
+    def nbytes(self) -> int:
+        return self.codes.nbytes + self.scales.nbytes
+
+    def row(self, i: int) -> np.ndarray:
+        """Dequantize a single vector to float32."""
+        return self.codes[i].astype(np.float32) * self.scales[i]
+
+    def dequantize(self) -> np.ndarray:
+        return self.codes.astype(np.float32) * self.scales[:, None]
+
+
+def quantize_int8(vectors: np.ndarray) -> QuantizedEmbeddings:
+    """Scalar-quantize each row symmetrically to [-127, 127] using its max absolute value."""
+    vectors = np.atleast_2d(np.asarray(vectors, dtype=np.float32))
+    scales = np.abs(vectors).max(axis=1) / 127.0
+    scales[scales == 0] = 1.0
+    codes = np.rint(vectors / scales[:, None]).astype(np.int8)
+    return QuantizedEmbeddings(codes=codes, scales=scales.astype(np.float32))
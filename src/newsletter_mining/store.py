@@ -0,0 +1,529 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+from collections.abc import Iterator
+from datetime import datetime, timezone
+from itertools import groupby
+from pathlib import Path
+
+import numpy as np
+from rich.console import Console
+
+from newsletter_mining.config import load_config, store_journal_mode
+from newsletter_mining.models import (
+    AnalysisResult,
+    ClusterReport,
+    ExtractedProblem,
+    ProblemCluster,
+    ProblemExcerpt,
+    ProblemWithEmbedding,
+)
+from newsletter_mining.parser import parse_date
+
+console = Console()
+
+OUTPUT_DIR = Path("output")
+DEFAULT_DB_PATH = OUTPUT_DIR / "newsletter_mining.db"
+
+SCHEMA = """\
+CREATE TABLE IF NOT EXISTS newsletters (
+    id INTEGER PRIMARY KEY,
+    source_file TEXT NOT NULL UNIQUE,
+    analyzed_at TEXT NOT NULL,
+    subject TEXT NOT NULL DEFAULT '',
+    sender TEXT NOT NULL DEFAULT '',
+    newsletter_date TEXT NOT NULL DEFAULT '',
+    published_ts REAL,  -- parsed newsletter date, NULL if undated
+    overall_sentiment TEXT NOT NULL DEFAULT '',
+    key_topics TEXT NOT NULL DEFAULT '[]'
+);
+CREATE INDEX IF NOT EXISTS idx_newsletters_published ON newsletters(published_ts DESC, id);
+
+CREATE TABLE IF NOT EXISTS problems (
+    id INTEGER PRIMARY KEY,
+    newsletter_id INTEGER NOT NULL REFERENCES newsletters(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    problem_id TEXT NOT NULL,
+    problem_summary TEXT NOT NULL,
+    problem_detail TEXT NOT NULL,
+    category TEXT NOT NULL,
+    severity TEXT NOT NULL,
+    original_quote TEXT NOT NULL DEFAULT '',
+    context TEXT NOT NULL DEFAULT '',
+    signals TEXT NOT NULL DEFAULT '[]',
+    mentioned_tools TEXT NOT NULL DEFAULT '[]',
+    target_audience TEXT NOT NULL DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS idx_problems_newsletter ON problems(newsletter_id, position);
+CREATE INDEX IF NOT EXISTS idx_problems_severity ON problems(severity);
+CREATE INDEX IF NOT EXISTS idx_problems_category ON problems(category);
+
+CREATE TABLE IF NOT EXISTS cluster_reports (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    generated_at TEXT NOT NULL,
+    total_problems INTEGER NOT NULL,
+    total_clusters INTEGER NOT NULL,
+    trend_bucket TEXT NOT NULL DEFAULT 'month',
+    trend_buckets TEXT NOT NULL DEFAULT '[]'
+);
+
+CREATE TABLE IF NOT EXISTS clusters (
+    cluster_id TEXT PRIMARY KEY,
+    position INTEGER NOT NULL,
+    cluster_name TEXT NOT NULL,
+    cluster_summary TEXT NOT NULL DEFAULT '',
+    mention_count INTEGER NOT NULL,
+    trend TEXT NOT NULL,
+    trend_series TEXT NOT NULL DEFAULT '[]',
+    problem_ids TEXT NOT NULL DEFAULT '[]',
+    sources TEXT NOT NULL DEFAULT '[]'
+);
+CREATE INDEX IF NOT EXISTS idx_clusters_position ON clusters(position);
+
+-- Counts per day bucket (UTC date of the newsletter, or 'undated') and dimension, maintained on write.
+CREATE TABLE IF NOT EXISTS aggregates (
+    bucket TEXT NOT NULL,
+    dimension TEXT NOT NULL,
+    key TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (dimension, bucket, key)
+);
+
+-- Embedding cache keyed by text hash, always full-precision float32 vectors
+-- (int8 quantization only applies to the clustering working set). dimensions = 0
+-- means the model default.
+CREATE TABLE IF NOT EXISTS embeddings (
+    text_hash TEXT NOT NULL,
+    model TEXT NOT NULL,
+    dimensions INTEGER NOT NULL,
+    vector BLOB NOT NULL,
+    PRIMARY KEY (text_hash, model, dimensions)
+);
+"""
+
+# Per-dimension contributions of one newsletter, scaled by {sign} (+1 on insert, -1 on delete).
+AGGREGATE_CONTRIBUTIONS = [
+    "SELECT :bucket, 'newsletters', '', {sign} WHERE true",
+    "SELECT :bucket, 'problems', '', {sign} * COUNT(*) FROM problems WHERE newsletter_id = :id "
+    "HAVING COUNT(*) > 0",
+    "SELECT :bucket, 'severity', severity, {sign} * COUNT(*) FROM problems WHERE newsletter_id = :id "
+    "GROUP BY severity",
+    "SELECT :bucket, 'category', category, {sign} * COUNT(*) FROM problems WHERE newsletter_id = :id "
+    "GROUP BY category",
+    # A tool listed twice by the same problem counts once
+    "SELECT :bucket, 'tool', tool, {sign} * COUNT(*) FROM (SELECT DISTINCT problems.id, t.value AS tool "
+    "FROM problems, json_each(problems.mentioned_tools) t WHERE newsletter_id = :id) GROUP BY tool",
+    "SELECT :bucket, 'sender', n.sender, {sign} * COUNT(*) FROM problems p "
+    "JOIN newsletters n ON n.id = p.newsletter_id WHERE p.newsletter_id = :id AND n.sender != '' "
+    "GROUP BY n.sender",
+]
+
+UNDATED_BUCKET = "undated"
+
+PROBLEM_COLUMNS = (
+    "problem_id, problem_summary, problem_detail, category, severity, original_quote, "
+    "context, signals, mentioned_tools, target_audience"
+)
+
+
+class ResultStore:
+    """SQLite-backed store for analysis results and cluster reports.
+
+    Replaces the per-file ``output/*_analysis.json`` layout: results are keyed by
+    their source file, written in a single transaction, and read back through
+    streaming cursors so ``cluster`` and ``report`` never hold the raw JSON of
+    the whole corpus in memory.
+    """
+
+    def __init__(self, path: str | Path | None = None, journal_mode: str | None = None):
+        self.path = Path(path or load_config()["result_store_path"] or DEFAULT_DB_PATH)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        journal_mode = journal_mode or store_journal_mode()
+        # Several processes may write concurrently (see work_queue): wait for locks
+        self.conn = sqlite3.connect(self.path, timeout=30)
+        self.conn.execute(f"PRAGMA journal_mode={journal_mode}")
+        self.conn.execute(f"PRAGMA synchronous={'NORMAL' if journal_mode == 'wal' else 'FULL'}")
+        self.conn.execute("PRAGMA foreign_keys=ON")
+        self.conn.executescript(SCHEMA)
+
+    def __enter__(self) -> ResultStore:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.conn.close()
+
+    # -- analysis results -------------------------------------------------
+
+    def save_result(self, result: AnalysisResult) -> None:
+        """Insert or replace the result for ``result.source_file`` atomically."""
+        with self.conn:
+            self.write_result(result)
+
+    def write_result(self, result: AnalysisResult) -> None:
+        """Insert or replace a result inside the caller's transaction.
+
+        Results are keyed by their resolved source path, so the same file analyzed
+        from different working directories (or through the work queue) is stored once.
+        """
+        source_file = normalize_source_file(result.source_file)
+        previous = self.conn.execute(
+            "SELECT id FROM newsletters WHERE source_file = ?", (source_file,)
+        ).fetchone()
+        if previous:
+            self._bump_aggregates(previous[0], -1)
+            self.conn.execute("DELETE FROM newsletters WHERE id = ?", (previous[0],))
+
+        cursor = self.conn.execute(
+            "INSERT INTO newsletters (source_file, analyzed_at, subject, sender, newsletter_date, "
+            "published_ts, overall_sentiment, key_topics) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                source_file,
+                result.analyzed_at.isoformat(),
+                result.newsletter_subject,
+                result.newsletter_sender,
+                result.newsletter_date,
+                _timestamp(result.newsletter_date),
+                result.overall_sentiment,
+                json.dumps(result.key_topics),
+            ),
+        )
+        newsletter_id = cursor.lastrowid
+        self.conn.executemany(
+            f"INSERT INTO problems (newsletter_id, position, {PROBLEM_COLUMNS}) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    newsletter_id,
+                    position,
+                    p.id,
+                    p.problem_summary,
+                    p.problem_detail,
+                    p.category,
+                    p.severity.value,
+                    p.original_quote,
+                    p.context,
+                    json.dumps(p.signals),
+                    json.dumps(p.mentioned_tools),
+                    p.target_audience,
+                )
+                for position, p in enumerate(result.problems)
+            ],
+        )
+        self._bump_aggregates(newsletter_id, 1)
+
+    def _bump_aggregates(self, newsletter_id: int, sign: int) -> None:
+        """Add (sign=1) or remove (sign=-1) one newsletter's contribution to the aggregates."""
+        ts = self.conn.execute(
+            "SELECT published_ts FROM newsletters WHERE id = ?", (newsletter_id,)
+        ).fetchone()[0]
+        params = {"bucket": _bucket(ts), "id": newsletter_id}
+        for select in AGGREGATE_CONTRIBUTIONS:
+            self.conn.execute(
+                f"INSERT INTO aggregates (bucket, dimension, key, count) {select.format(sign=int(sign))} "
+                "ON CONFLICT (dimension, bucket, key) DO UPDATE SET count = count + excluded.count",
+                params,
+            )
+        if sign < 0:
+            self.conn.execute("DELETE FROM aggregates WHERE count <= 0")
+
+    def count_newsletters(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM newsletters").fetchone()[0]
+
+    def aggregate_counts(
+        self,
+        dimension: str,
+        since: datetime | None = None,
+        limit: int | None = None,
+    ) -> list[tuple[str, int]]:
+        """Return ``(key, count)`` pairs for a dimension, largest first.
+
+        Dimensions: ``newsletters``, ``problems``, ``severity``, ``category``, ``tool``, ``sender``.
+        Only the aggregates table is read, so the cost is independent of the corpus size.
+        Undated newsletters are counted unless ``since`` is given.
+        """
+        since_bucket = _bucket(since.timestamp()) if since else None
+        return self.conn.execute(
+            "SELECT key, SUM(count) AS total FROM aggregates "
+            "WHERE dimension = ? AND (? IS NULL OR (bucket >= ? AND bucket != ?)) "
+            "GROUP BY key ORDER BY total DESC, key LIMIT ?",
+            (dimension, since_bucket, since_bucket, UNDATED_BUCKET, limit if limit is not None else -1),
+        ).fetchall()
+
+    def monthly_problem_counts(self, since: datetime | None = None) -> list[tuple[str, int]]:
+        """Return ``(YYYY-MM, problem count)`` pairs in chronological order, undated problems excluded."""
+        return self.conn.execute(
+            "SELECT substr(bucket, 1, 7) AS month, SUM(count) FROM aggregates "
+            "WHERE dimension = 'problems' AND bucket != ? AND bucket >= ? GROUP BY month ORDER BY month",
+            (UNDATED_BUCKET, _bucket(since.timestamp()) if since else ""),
+        ).fetchall()
+
+    def results_page(
+        self,
+        since: datetime | None = None,
+        limit: int = 20,
+        after: str | None = None,
+    ) -> tuple[list[AnalysisResult], str | None]:
+        """Return one page of results, most recent newsletter first, and the cursor of the next page.
+
+        Pages are keyed on the last ``(published_ts, id)`` seen rather than an offset:
+        ``after`` is the cursor returned with the previous page, so every page is a
+        range scan of ``idx_newsletters_published`` however deep it is. Undated
+        newsletters come last, and are left out when ``since`` is given.
+        The next cursor is None on the last page; a malformed ``after`` raises ValueError.
+        """
+        after_ts, after_id = _parse_cursor(after) if after else (float("inf"), -1)
+
+        keys: list[tuple[int, float | None]] = []
+        if after_ts is not None:
+            keys = self.conn.execute(
+                "SELECT id, published_ts FROM newsletters "
+                "WHERE published_ts >= ? AND published_ts <= ? AND (published_ts < ? OR id > ?) "
+                "ORDER BY published_ts DESC, id LIMIT ?",
+                (since.timestamp() if since else float("-inf"), after_ts, after_ts, after_id, limit + 1),
+            ).fetchall()
+            after_id = -1
+        if len(keys) <= limit and since is None:
+            keys += self.conn.execute(
+                "SELECT id, published_ts FROM newsletters WHERE published_ts IS NULL AND id > ? "
+                "ORDER BY id LIMIT ?",
+                (after_id, limit + 1 - len(keys)),
+            ).fetchall()
+
+        next_cursor = None
+        if len(keys) > limit:
+            last_id, last_ts = keys[limit - 1]
+            next_cursor = _format_cursor(last_ts, last_id)
+        return list(self._iter_results([newsletter_id for newsletter_id, _ in keys[:limit]])), next_cursor
+
+    def _iter_results(self, newsletter_ids: list[int]) -> Iterator[AnalysisResult]:
+        """Load the given newsletters with their problems, in the order given."""
+        order = {newsletter_id: i for i, newsletter_id in enumerate(newsletter_ids)}
+        rows = self.conn.execute(
+            "SELECT n.id, n.source_file, n.analyzed_at, n.subject, n.sender, n.newsletter_date, "
+            f"n.overall_sentiment, n.key_topics, {_prefixed('p', PROBLEM_COLUMNS)} "
+            "FROM newsletters n LEFT JOIN problems p ON p.newsletter_id = n.id "
+            f"WHERE n.id IN ({', '.join('?' * len(newsletter_ids))}) ORDER BY n.id, p.position",
+            newsletter_ids,
+        ).fetchall()
+        rows.sort(key=lambda row: order[row[0]])  # Stable: keeps the problem positions
+        for _, group in groupby(rows, key=lambda row: row[0]):
+            group = list(group)
+            head = group[0]
+            yield AnalysisResult(
+                source_file=head[1],
+                analyzed_at=datetime.fromisoformat(head[2]),
+                newsletter_subject=head[3],
+                newsletter_sender=head[4],
+                newsletter_date=head[5],
+                overall_sentiment=head[6],
+                key_topics=json.loads(head[7]),
+                problems=[_row_to_problem(row[8:]) for row in group if row[8] is not None],
+            )
+
+    def iter_problems(self) -> Iterator[ProblemWithEmbedding]:
+        """Stream the problems to cluster, reading only the columns clustering uses.
+
+        Problems come as ``ProblemExcerpt`` (id, summary, detail and quote), with their
+        source file and publication timestamp; use ``results_page`` for complete problems.
+        """
+        cursor = self.conn.execute(
+            "SELECT n.source_file, n.published_ts, p.problem_id, p.problem_summary, "
+            "p.problem_detail, p.original_quote "
+            "FROM problems p JOIN newsletters n ON n.id = p.newsletter_id "
+            "ORDER BY n.source_file, p.position"
+        )
+        for source_file, published_ts, problem_id, summary, detail, quote in cursor:
+            yield ProblemWithEmbedding(
+                problem=ProblemExcerpt(
+                    id=problem_id,
+                    problem_summary=summary,
+                    problem_detail=detail,
+                    original_quote=quote,
+                ),
+                source_file=source_file,
+                published_ts=published_ts,
+            )
+
+    # -- cluster reports --------------------------------------------------
+
+    def save_cluster_report(self, report: ClusterReport) -> None:
+        """Replace the stored cluster report atomically."""
+        with self.conn:
+            self.conn.execute("DELETE FROM clusters")
+            self.conn.execute(
+                "INSERT OR REPLACE INTO cluster_reports (id, generated_at, total_problems, total_clusters, "
+                "trend_bucket, trend_buckets) VALUES (1, ?, ?, ?, ?, ?)",
+                (
+                    report.generated_at.isoformat(),
+                    report.total_problems,
+                    report.total_clusters,
+                    report.trend_bucket,
+                    json.dumps(report.trend_buckets),
+                ),
+            )
+            self.conn.executemany(
+                "INSERT INTO clusters (cluster_id, position, cluster_name, cluster_summary, "
+                "mention_count, trend, trend_series, problem_ids, sources) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        c.cluster_id,
+                        position,
+                        c.cluster_name,
+                        c.cluster_summary,
+                        c.mention_count,
+                        c.trend.value,
+                        json.dumps(c.trend_series),
+                        json.dumps(c.problem_ids),
+                        json.dumps(c.sources),
+                    )
+                    for position, c in enumerate(report.clusters)
+                ],
+            )
+
+    def load_cluster_report(self, limit: int | None = None) -> ClusterReport | None:
+        head = self.conn.execute(
+            "SELECT generated_at, total_problems, total_clusters, trend_bucket, trend_buckets "
+            "FROM cluster_reports WHERE id = 1"
+        ).fetchone()
+        if head is None:
+            return None
+
+        clusters = [
+            ProblemCluster(
+                cluster_id=row[0],
+                cluster_name=row[1],
+                cluster_summary=row[2],
+                mention_count=row[3],
+                trend=row[4],
+                trend_series=json.loads(row[5]),
+                problem_ids=json.loads(row[6]),
+                sources=json.loads(row[7]),
+            )
+            for row in self.conn.execute(
+                "SELECT cluster_id, cluster_name, cluster_summary, mention_count, trend, "
+                "trend_series, problem_ids, sources FROM clusters ORDER BY position LIMIT ?",
+                (limit if limit is not None else -1,),
+            )
+        ]
+        return ClusterReport(
+            generated_at=datetime.fromisoformat(head[0]),
+            total_problems=head[1],
+            total_clusters=head[2],
+            trend_bucket=head[3],
+            trend_buckets=json.loads(head[4]),
+            clusters=clusters,
+        )
+
+    # -- embedding cache --------------------------------------------------
+
+    def iter_embeddings(
+        self,
+        hashes: list[str],
+        model: str,
+        dimensions: int | None,
+    ) -> Iterator[tuple[list[str], np.ndarray]]:
+        """Stream cached float32 vectors as ``(text hashes, matrix)`` chunks of up to 500 rows.
+
+        Hashes without a cached vector are skipped.
+        """
+        for start in range(0, len(hashes), 500):
+            chunk = hashes[start:start + 500]
+            rows = self.conn.execute(
+                f"SELECT text_hash, vector FROM embeddings WHERE model = ? AND dimensions = ? "
+                f"AND text_hash IN ({', '.join('?' * len(chunk))})",
+                (model, dimensions or 0, *chunk),
+            ).fetchall()
+            if rows:
+                yield [h for h, _ in rows], np.stack([np.frombuffer(blob, dtype=np.float32) for _, blob in rows])
+
+    def save_embeddings(self, hashes: list[str], vectors: np.ndarray, model: str, dimensions: int | None) -> None:
+        """Cache float32 vectors by text hash."""
+        vectors = np.asarray(vectors, dtype=np.float32)
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (text_hash, model, dimensions, vector) VALUES (?, ?, ?, ?)",
+                [(h, model, dimensions or 0, v.tobytes()) for h, v in zip(hashes, vectors)],
+            )
+
+    # -- legacy import ----------------------------------------------------
+
+    def import_json(self, directory: str | Path = OUTPUT_DIR) -> tuple[int, bool]:
+        """Import legacy ``*_analysis.json`` and ``cluster_report.json`` files.
+
+        Returns the number of imported results and whether a cluster report was imported.
+        All results are written in a single transaction, so a failed import leaves them untouched.
+        """
+        directory = Path(directory)
+        imported = 0
+        with self.conn:
+            for json_file in sorted(directory.glob("*_analysis.json")):
+                try:
+                    data = json.loads(json_file.read_text(encoding="utf-8"))
+                    result = AnalysisResult(**data)
+                except Exception as e:
+                    console.print(f"[yellow]Warning: Could not load {json_file}: {e}[/yellow]")
+                    continue
+                self.write_result(result)
+                imported += 1
+
+        cluster_path = directory / "cluster_report.json"
+        cluster_imported = False
+        if cluster_path.exists():
+            try:
+                data = json.loads(cluster_path.read_text(encoding="utf-8"))
+                self.save_cluster_report(ClusterReport(**data))
+                cluster_imported = True
+            except Exception as e:
+                console.print(f"[yellow]Warning: Could not load {cluster_path}: {e}[/yellow]")
+
+        return imported, cluster_imported
+
+
+def normalize_source_file(path: str | Path) -> str:
+    """Key under which a newsletter file is stored and queued: its absolute, resolved path."""
+    return str(Path(path).resolve())
+
+
+def _format_cursor(published_ts: float | None, newsletter_id: int) -> str:
+    """Page cursor ``<published_ts>:<id>``, with an empty timestamp for undated newsletters."""
+    return f"{'' if published_ts is None else repr(published_ts)}:{newsletter_id}"
+
+
+def _parse_cursor(cursor: str) -> tuple[float | None, int]:
+    published_ts, _, newsletter_id = cursor.rpartition(":")
+    return (float(published_ts) if published_ts else None), int(newsletter_id)
+
+
+def _timestamp(newsletter_date: str) -> float | None:
+    """Timestamp of a newsletter's parsed date, or None when it has none (e.g. .html/.txt files)."""
+    parsed = parse_date(newsletter_date)
+    return parsed.timestamp() if parsed else None
+
+
+def _bucket(ts: float | None) -> str:
+    if ts is None:
+        return UNDATED_BUCKET
+    return datetime.fromtimestamp(ts, tz=timezone.utc).strftime("%Y-%m-%d")
+
+
+def _prefixed(alias: str, columns: str) -> str:
+    return ", ".join(f"{alias}.{c.strip()}" for c in columns.split(","))
+
+
+def _row_to_problem(row: tuple) -> ExtractedProblem:
+    return ExtractedProblem(
+        id=row[0],
+        problem_summary=row[1],
+        problem_detail=row[2],
+        category=row[3],
+        severity=row[4],
+        original_quote=row[5],
+        context=row[6],
+        signals=json.loads(row[7]),
+        mentioned_tools=json.loads(row[8]),
+        target_audience=row[9],
+    )
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import numpy as np
+
+from newsletter_mining.models import ClusterReport, Trend
+
+SECONDS_PER_DAY = 86400
+BUCKETS = ("week", "month")
+
+
+def compute_trends(
+    report: ClusterReport,
+    bucket: str = "month",
+    window: int = 6,
+    threshold: float = 0.1,
+    min_mentions: int = 3,
+) -> ClusterReport:
+    """Derive each cluster's trend from the dates of the newsletters mentioning it.
+
+    Mentions are counted per cluster and per week/month bucket in a single
+    ``bincount`` over ``cluster * n_buckets + bucket`` indices. The trend comes from
+    the least-squares slope over the last ``window`` buckets, relative to the mean
+    mention count in that window. Mentions from undated newsletters are left out:
+
+    - emerging: no mentions before the window, while the corpus spans more than it
+    - growing / declining: relative slope above ``threshold`` / below ``-threshold``
+    - stable: anything else, including clusters with fewer than ``min_mentions``
+      dated mentions
+    """
+    if bucket not in BUCKETS:
+        raise ValueError(f"Unsupported trend bucket: {bucket}. Use one of {', '.join(BUCKETS)}")
+
+    cluster_of = {pid: i for i, c in enumerate(report.clusters) for pid in c.problem_ids}
+    members = [
+        (cluster_of[pw.problem.id], pw.published_ts)
+        for pw in report.problems
+        if pw.problem.id in cluster_of and pw.published_ts is not None
+    ]
+    if not members:
+        return report
+
+    cluster_idx = np.fromiter((m[0] for m in members), dtype=np.int64, count=len(members))
+    timestamps = np.fromiter((m[1] for m in members), dtype=np.float64, count=len(members))
+
+    days = np.floor_divide(timestamps, SECONDS_PER_DAY).astype(np.int64)
+    if bucket == "month":
+        bucket_idx = days.astype("datetime64[D]").astype("datetime64[M]").astype(np.int64)
+    else:
+        # 1970-01-01 was a Thursday: shift by 3 days so weeks start on Monday
+        bucket_idx = (days + 3) // 7
+    first_bucket = int(bucket_idx.min())
+    bucket_idx -= first_bucket
+    n_buckets = int(bucket_idx.max()) + 1
+    n_clusters = len(report.clusters)
+
+    counts = np.bincount(
+        cluster_idx * n_buckets + bucket_idx,
+        minlength=n_clusters * n_buckets,
+    ).reshape(n_clusters, n_buckets)
+
+    width = max(1, min(window, n_buckets))
+    recent = counts[:, -width:].astype(np.float64)
+    earlier = counts[:, :-width].sum(axis=1) if n_buckets > width else np.zeros(n_clusters, dtype=np.int64)
+
+    x = np.arange(width, dtype=np.float64) - (width - 1) / 2
+    denom = float(x @ x)
+    slope = recent @ x / denom if denom else np.zeros(n_clusters)
+    mean = recent.mean(axis=1)
+    relative = np.divide(slope, mean, out=np.zeros(n_clusters), where=mean > 0)
+
+    dated = counts.sum(axis=1)
+    trends = np.select(
+        [
+            dated < min_mentions,
+            (n_buckets > width) & (earlier == 0) & (mean > 0),
+            relative >= threshold,
+            (relative <= -threshold) | (mean == 0),
+        ],
+        [Trend.STABLE.value, Trend.EMERGING.value, Trend.GROWING.value, Trend.DECLINING.value],
+        default=Trend.STABLE.value,
+    )
+
+    labels = _bucket_labels(bucket, first_bucket, n_buckets)
+    report.trend_bucket = bucket
+    report.trend_buckets = labels
+    for cluster, trend, series in zip(report.clusters, trends, counts.tolist()):
+        cluster.trend = Trend(trend)
+        cluster.trend_series = series
+
+    return report
+
+
+def _bucket_labels(bucket: str, first_bucket: int, n_buckets: int) -> list[str]:
+    indices = np.arange(first_bucket, first_bucket + n_buckets)
+    if bucket == "month":
+        return [str(m) for m in indices.astype("datetime64[M]")]
+    return [str(d) for d in (indices * 7 - 3).astype("datetime64[D]")]
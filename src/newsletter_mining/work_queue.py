@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+import uuid
+from pathlib import Path
+
+from pydantic import BaseModel
+
+from newsletter_mining.models import AnalysisResult
+from newsletter_mining.store import ResultStore, normalize_source_file
+
+QUEUE_SCHEMA = """\
+CREATE TABLE IF NOT EXISTS queue_items (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    status TEXT NOT NULL DEFAULT 'pending',  -- pending | leased | done | failed
+    attempts INTEGER NOT NULL DEFAULT 0,
+    lease_owner TEXT,
+    lease_token TEXT,
+    lease_expires_at REAL,
+    enqueued_at REAL NOT NULL,
+    finished_at REAL,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_queue_claim ON queue_items(status, lease_expires_at);
+CREATE INDEX IF NOT EXISTS idx_queue_token ON queue_items(lease_token);
+"""
+
+
+class QueueLease(BaseModel):
+    item_id: int
+    path: str
+    owner: str
+    token: str
+    attempt: int
+
+
+class WorkQueue:
+    """Lease-based work queue of newsletter files, stored next to the results.
+
+    Workers on any number of processes or hosts ``claim`` an item, which leases it
+    for a limited time, keep the lease alive with ``heartbeat`` and finish with
+    ``complete``. A lease that is not renewed expires and the item goes back to the
+    next ``claim``, so a crashed worker never loses work.
+
+    ``complete`` writes the result and marks the item done in one transaction, and
+    only if the caller still holds the lease: a worker whose lease expired and was
+    taken over has its late result discarded, so no result is ever written twice.
+
+    Leases are compared against each host's wall clock, so lease durations must be
+    much larger than the clock skew between hosts. Across hosts, the store must use
+    ``STORE_JOURNAL_MODE=delete`` (WAL does not work on shared volumes).
+    """
+
+    def __init__(self, store: ResultStore):
+        self.store = store
+        self.conn = store.conn
+        self.conn.executescript(QUEUE_SCHEMA)
+
+    def enqueue(self, paths: list[Path]) -> int:
+        """Register files; already queued ones are ignored unless they failed. Returns the number added."""
+        now = time.time()
+        before = self.conn.total_changes
+        with self.conn:
+            self.conn.executemany(
+                "INSERT INTO queue_items (path, enqueued_at) VALUES (?, ?) "
+                "ON CONFLICT (path) DO UPDATE SET status = 'pending', attempts = 0, error = NULL, "
+                "enqueued_at = excluded.enqueued_at WHERE status = 'failed'",
+                [(normalize_source_file(p), now) for p in paths],
+            )
+        return self.conn.total_changes - before
+
+    def claim(self, owner: str, lease_seconds: float, max_attempts: int = 3) -> QueueLease | None:
+        """Lease the oldest pending (or expired) item, or return None if there is none."""
+        now = time.time()
+        token = uuid.uuid4().hex
+        with self.conn:
+            # Items whose leases kept expiring are most likely crashing their workers
+            self.conn.execute(
+                "UPDATE queue_items SET status = 'failed', lease_token = NULL, finished_at = ?, "
+                "error = 'lease expired ' || attempts || ' time(s)' "
+                "WHERE status = 'leased' AND lease_expires_at < ? AND attempts >= ?",
+                (now, now, max_attempts),
+            )
+            self.conn.execute(
+                "UPDATE queue_items SET status = 'leased', lease_owner = ?, lease_token = ?, "
+                "lease_expires_at = ?, attempts = attempts + 1 "
+                "WHERE id = (SELECT id FROM queue_items "
+                "WHERE status = 'pending' OR (status = 'leased' AND lease_expires_at < ?) "
+                "ORDER BY id LIMIT 1)",
+                (owner, token, now + lease_seconds, now),
+            )
+            row = self.conn.execute(
+                "SELECT id, path, attempts FROM queue_items WHERE lease_token = ?", (token,)
+            ).fetchone()
+
+        if row is None:
+            return None
+        return QueueLease(item_id=row[0], path=row[1], owner=owner, token=token, attempt=row[2])
+
+    def heartbeat(self, lease: QueueLease, lease_seconds: float) -> bool:
+        """Extend a lease. Returns False if it was lost (expired and taken by another worker)."""
+        with self.conn:
+            cursor = self.conn.execute(
+                "UPDATE queue_items SET lease_expires_at = ? "
+                "WHERE id = ? AND lease_token = ? AND status = 'leased'",
+                (time.time() + lease_seconds, lease.item_id, lease.token),
+            )
+        return cursor.rowcount == 1
+
+    def complete(self, lease: QueueLease, result: AnalysisResult | None) -> bool:
+        """Atomically save the result and mark the item done, if the lease is still held."""
+        try:
+            with self.conn:
+                cursor = self.conn.execute(
+                    "UPDATE queue_items SET status = 'done', lease_token = NULL, finished_at = ?, error = NULL "
+                    "WHERE id = ? AND lease_token = ? AND status = 'leased'",
+                    (time.time(), lease.item_id, lease.token),
+                )
+                if cursor.rowcount != 1:
+                    raise _LeaseLost
+                if result is not None:
+                    self.store.write_result(result)
+        except _LeaseLost:
+            return False
+        return True
+
+    def fail(self, lease: QueueLease, error: str, max_attempts: int = 3) -> None:
+        """Give an item back for another attempt, or mark it failed after ``max_attempts``."""
+        with self.conn:
+            self.conn.execute(
+                "UPDATE queue_items SET status = CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END, "
+                "lease_token = NULL, lease_expires_at = NULL, error = ?, "
+                "finished_at = CASE WHEN attempts >= ? THEN ? END "
+                "WHERE id = ? AND lease_token = ? AND status = 'leased'",
+                (max_attempts, error, max_attempts, time.time(), lease.item_id, lease.token),
+            )
+
+    def counts(self) -> dict[str, int]:
+        return dict(self.conn.execute("SELECT status, COUNT(*) FROM queue_items GROUP BY status"))
+
+
+class LeaseHeartbeat:
+    """Background thread renewing a lease every third of its duration.
+
+    Uses its own store connection, since SQLite connections are bound to their thread.
+    ``lost`` is set if the lease could not be renewed.
+    """
+
+    def __init__(self, store_path: Path, lease: QueueLease, lease_seconds: float):
+        self.lost = threading.Event()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(store_path, lease, lease_seconds),
+            daemon=True,
+        )
+
+    def __enter__(self) -> LeaseHeartbeat:
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self, store_path: Path, lease: QueueLease, lease_seconds: float) -> None:
+        with ResultStore(store_path) as store:
+            queue = WorkQueue(store)
+            while not self._stop.wait(lease_seconds / 3):
+                try:
+                    renewed = queue.heartbeat(lease, lease_seconds)
+                except sqlite3.OperationalError:
+                    continue  # Store busy: retry on the next beat, the lease has slack
+                if not renewed:
+                    self.lost.set()
+                    return
+
+
+class _LeaseLost(Exception):
+    pass
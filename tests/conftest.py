@@ -0,0 +1,9 @@
+import pytest
+
+from newsletter_mining.store import ResultStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    with ResultStore(tmp_path / "store.db", journal_mode="wal") as store:
+        yield store
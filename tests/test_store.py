@@ -0,0 +1,133 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from newsletter_mining.models import AnalysisResult, ExtractedProblem, ProblemExcerpt
+
+
+def problem(pid: str, severity: str = "high", category: str = "devops", tools: list[str] | None = None) -> ExtractedProblem:
+    return ExtractedProblem(
+        id=pid,
+        problem_summary=f"Problem {pid}",
+        problem_detail="Detail",
+        category=category,
+        severity=severity,
+        mentioned_tools=tools or [],
+    )
+
+
+def result(source_file: str, date: str = "", sender: str = "", problems: list[ExtractedProblem] | None = None) -> AnalysisResult:
+    return AnalysisResult(
+        source_file=source_file,
+        newsletter_date=date,
+        newsletter_sender=sender,
+        problems=problems or [],
+    )
+
+
+def aggregates(store) -> set[tuple]:
+    return set(store.conn.execute("SELECT bucket, dimension, key, count FROM aggregates"))
+
+
+def test_aggregates_count_each_dimension(store):
+    store.save_result(result("a.eml", "2024-07-01", "ops@example.com", [
+        problem("1", "high", "devops", ["k8s", "helm"]),
+        problem("2", "low", "security", ["k8s"]),
+    ]))
+
+    assert store.aggregate_counts("newsletters") == [("", 1)]
+    assert store.aggregate_counts("problems") == [("", 2)]
+    assert store.aggregate_counts("severity") == [("high", 1), ("low", 1)]
+    assert store.aggregate_counts("category") == [("devops", 1), ("security", 1)]
+    assert store.aggregate_counts("tool") == [("k8s", 2), ("helm", 1)]
+    assert store.aggregate_counts("sender") == [("ops@example.com", 2)]
+
+
+def test_tool_listed_twice_counts_once(store):
+    store.save_result(result("a.eml", problems=[problem("1", tools=["X", "X"]), problem("2", tools=["X"])]))
+
+    assert store.aggregate_counts("tool") == [("X", 2)]
+
+
+def test_replacing_a_result_replaces_its_contribution(store):
+    store.save_result(result("a.eml", "2024-07-01", "a@example.com", [problem("1", "high", tools=["k8s"])]))
+    store.save_result(result("b.eml", "2024-07-02", "b@example.com", [problem("2", "low")]))
+    expected = aggregates(store)
+
+    store.save_result(result("a.eml", "2024-08-15", "c@example.com", [
+        problem("3", "critical", tools=["terraform"]),
+        problem("4", "critical"),
+    ]))
+
+    assert store.count_newsletters() == 2
+    assert store.aggregate_counts("severity") == [("critical", 2), ("low", 1)]
+    assert store.aggregate_counts("tool") == [("terraform", 1)]
+    assert store.monthly_problem_counts() == [("2024-07", 1), ("2024-08", 2)]
+
+    store.save_result(result("a.eml", "2024-07-01", "a@example.com", [problem("1", "high", tools=["k8s"])]))
+    assert aggregates(store) == expected
+
+
+def test_source_files_are_normalized(store, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    store.save_result(result("a.eml", problems=[problem("1")]))
+    store.save_result(result(str(tmp_path / "a.eml"), problems=[problem("2")]))
+
+    assert store.count_newsletters() == 1
+    assert store.aggregate_counts("problems") == [("", 1)]
+
+
+def test_undated_newsletters(store):
+    store.save_result(result("dated.eml", "2024-07-01", problems=[problem("1")]))
+    store.save_result(result("undated.txt", problems=[problem("2"), problem("3")]))
+    since = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+    assert store.aggregate_counts("problems") == [("", 3)]
+    assert store.aggregate_counts("problems", since=since) == [("", 1)]
+    assert store.monthly_problem_counts() == [("2024-07", 1)]
+    assert [pw.published_ts is None for pw in store.iter_problems()] == [False, True, True]
+
+
+def test_iter_problems_reads_excerpts(store):
+    stored = problem("1", tools=["k8s"])
+    stored.original_quote = "It broke again"
+    store.save_result(result("a.eml", "2024-07-01", problems=[stored]))
+
+    [pw] = store.iter_problems()
+
+    assert pw.problem == ProblemExcerpt(
+        id="1", problem_summary="Problem 1", problem_detail="Detail", original_quote="It broke again"
+    )
+    assert pw.source_file.endswith("a.eml") and pw.published_ts is not None
+
+
+@pytest.mark.parametrize("page_size", [1, 2, 3, 10])
+def test_results_page_walks_every_newsletter_once(store, page_size):
+    for name, date in [
+        ("u1.txt", ""), ("d1.eml", "2024-03-01"), ("d2.eml", "2024-05-01"),
+        ("u2.txt", ""), ("d3.eml", "2024-05-01"), ("d4.eml", "2024-01-01"),
+    ]:
+        store.save_result(result(name, date, problems=[problem(name)]))
+
+    names, after = [], None
+    while True:
+        results, after = store.results_page(limit=page_size, after=after)
+        assert len(results) <= page_size
+        names += [r.problems[0].id for r in results]
+        if after is None:
+            break
+
+    assert names == ["d2.eml", "d3.eml", "d1.eml", "d4.eml", "u1.txt", "u2.txt"]
+
+    since = datetime(2024, 2, 1, tzinfo=timezone.utc)
+    results, after = store.results_page(since=since, limit=page_size)
+    names = [r.problems[0].id for r in results]
+    while after:
+        results, after = store.results_page(since=since, limit=page_size, after=after)
+        names += [r.problems[0].id for r in results]
+    assert names == ["d2.eml", "d3.eml", "d1.eml"]
+
+
+def test_results_page_rejects_malformed_cursors(store):
+    with pytest.raises(ValueError):
+        store.results_page(after="not-a-cursor")
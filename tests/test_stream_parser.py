@@ -0,0 +1,85 @@
+import json
+
+from newsletter_mining.analyzer import ProblemStreamParser, _parse_json_response
+
+RESPONSE = {
+    "problems": [
+        {"problem_summary": 'Says "it works" but it does not', "problem_detail": "Path C:\\temp\\}"},
+        {"problem_summary": "Nested", "problem_detail": "d", "related": {"problems": [{"id": "inner"}]}},
+    ],
+    "overall_sentiment": "frustrated",
+    "key_topics": ["ci", "{not a brace}"],
+}
+
+
+def feed_in_chunks(text: str, size: int) -> tuple[ProblemStreamParser, list[dict]]:
+    parser = ProblemStreamParser()
+    problems = []
+    for start in range(0, len(text), size):
+        problems += parser.feed(text[start:start + size])
+    return parser, problems
+
+
+def test_emits_each_problem_once_complete():
+    parser = ProblemStreamParser()
+    text = json.dumps(RESPONSE)
+    end_of_first = text.index("}, {") + 1
+
+    assert parser.feed(text[:end_of_first - 1]) == []
+    assert parser.feed(text[end_of_first - 1:end_of_first]) == [RESPONSE["problems"][0]]
+    assert parser.feed(text[end_of_first:]) == [RESPONSE["problems"][1]]
+
+
+def test_chunk_boundaries_do_not_matter():
+    text = json.dumps(RESPONSE, indent=2)
+    for size in [1, 2, 3, 7, 64, len(text)]:
+        parser, problems = feed_in_chunks(text, size)
+        assert problems == RESPONSE["problems"]
+        assert parser.text == text
+
+
+def test_escaped_quotes_and_braces_inside_strings():
+    problem = {"problem_summary": 'a \\"quoted\\" } ] { [ value', "problem_detail": "ends with backslash \\"}
+    text = json.dumps({"problems": [problem]})
+
+    _, problems = feed_in_chunks(text, 1)
+
+    assert problems == [problem]
+
+
+def test_ignores_problems_keys_not_at_top_level():
+    text = json.dumps({
+        "meta": {"problems": [{"id": "not a problem"}]},
+        "notes": ["problems", {"problems": [{"id": "nor this"}]}],
+        "problems": [{"id": "real"}],
+    })
+
+    _, problems = feed_in_chunks(text, 5)
+
+    assert problems == [{"id": "real"}]
+
+
+def test_problems_key_as_a_value_is_not_a_key():
+    text = json.dumps({"topic": "problems", "list": [{"id": "x"}], "problems": [{"id": "real"}]})
+
+    _, problems = feed_in_chunks(text, 3)
+
+    assert problems == [{"id": "real"}]
+
+
+def test_markdown_fences():
+    body = json.dumps(RESPONSE, indent=2)
+    text = f"```json\n{body}\n```"
+
+    parser, problems = feed_in_chunks(text, 4)
+
+    assert problems == RESPONSE["problems"]
+    assert _parse_json_response(parser.text) == RESPONSE
+
+
+def test_stops_at_a_malformed_problem():
+    text = '{"problems": [{"id": "a"}, {"id": oops}, {"id": "c"}]}'
+
+    _, problems = feed_in_chunks(text, 1)
+
+    assert problems == [{"id": "a"}]
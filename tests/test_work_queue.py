@@ -0,0 +1,114 @@
+import time
+
+import pytest
+
+from newsletter_mining.models import AnalysisResult
+from newsletter_mining.work_queue import WorkQueue
+
+LEASE = 60.0
+
+
+class Clock:
+    def __init__(self, now: float = 1_000_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(time, "time", clock)
+    return clock
+
+
+@pytest.fixture
+def queue(store, tmp_path, clock):
+    queue = WorkQueue(store)
+    queue.enqueue([tmp_path / "a.eml"])
+    return queue
+
+
+def test_enqueue_ignores_queued_files(queue, tmp_path):
+    assert queue.enqueue([tmp_path / "a.eml", tmp_path / "b.eml"]) == 1
+    assert queue.counts() == {"pending": 2}
+
+
+def test_claim_leases_each_item_once(queue):
+    lease = queue.claim("w1", LEASE)
+
+    assert lease is not None and lease.attempt == 1
+    assert queue.claim("w2", LEASE) is None
+
+
+def test_heartbeat_keeps_the_lease(queue, clock):
+    lease = queue.claim("w1", LEASE)
+
+    clock.advance(LEASE * 0.9)
+    assert queue.heartbeat(lease, LEASE)
+    clock.advance(LEASE * 0.9)
+
+    assert queue.claim("w2", LEASE) is None
+
+
+def test_expired_lease_is_taken_over(queue, clock):
+    first = queue.claim("w1", LEASE)
+    clock.advance(LEASE + 1)
+
+    second = queue.claim("w2", LEASE)
+
+    assert second is not None
+    assert second.item_id == first.item_id and second.owner == "w2" and second.attempt == 2
+    assert not queue.heartbeat(first, LEASE)
+
+
+def test_late_complete_is_rejected(queue, store, clock, tmp_path):
+    first = queue.claim("w1", LEASE)
+    clock.advance(LEASE + 1)
+    second = queue.claim("w2", LEASE)
+
+    assert not queue.complete(first, AnalysisResult(source_file=first.path, overall_sentiment="late"))
+    assert store.count_newsletters() == 0
+
+    assert queue.complete(second, AnalysisResult(source_file=second.path, overall_sentiment="on time"))
+    results, _ = store.results_page()
+    assert [r.overall_sentiment for r in results] == ["on time"]
+    assert queue.counts() == {"done": 1}
+    assert not queue.complete(second, AnalysisResult(source_file=second.path))
+
+
+def test_fail_retries_then_fails_after_max_attempts(queue):
+    for attempt in range(1, 3):
+        lease = queue.claim("w1", LEASE, max_attempts=3)
+        assert lease.attempt == attempt
+        queue.fail(lease, "boom", max_attempts=3)
+        assert queue.counts() == {"pending": 1}
+
+    lease = queue.claim("w1", LEASE, max_attempts=3)
+    queue.fail(lease, "boom", max_attempts=3)
+
+    assert queue.counts() == {"failed": 1}
+    assert queue.claim("w1", LEASE, max_attempts=3) is None
+
+
+def test_repeatedly_expired_lease_fails(queue, clock):
+    for _ in range(2):
+        assert queue.claim("w1", LEASE, max_attempts=2) is not None
+        clock.advance(LEASE + 1)
+
+    assert queue.claim("w1", LEASE, max_attempts=2) is None
+    assert queue.counts() == {"failed": 1}
+
+
+def test_failed_items_can_be_enqueued_again(queue, tmp_path):
+    lease = queue.claim("w1", LEASE, max_attempts=1)
+    queue.fail(lease, "boom", max_attempts=1)
+
+    assert queue.enqueue([tmp_path / "a.eml"]) == 1
+
+    lease = queue.claim("w1", LEASE)
+    assert lease is not None and lease.attempt == 1